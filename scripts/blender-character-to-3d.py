@@ -13,6 +13,10 @@ import bmesh
 import sys
 import os
 
+# Shared pixel access helper lives next to this script
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from blender_image_access import load_image
+
 # Clear existing mesh data
 bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete(use_global=False)
@@ -23,7 +27,7 @@ def load_sprite_image(image_path):
         print(f"Error: Image not found: {image_path}")
         return None
     
-    img = bpy.data.images.load(image_path)
+    img = load_image(image_path)
     return img
 
 def create_billboard_character(image_path, output_path, method='billboard-depth', depth=0.1):
@@ -7,6 +7,7 @@ import { execSync, spawn } from 'child_process'
 import fs from 'fs'
 import path from 'path'
 import { fileURLToPath } from 'url'
+import { preflightAssets, printPreflightReport } from './preflight-assets.js'
 
 const __filename = fileURLToPath(import.meta.url)
 const __dirname = path.dirname(__filename)
@@ -24,6 +25,9 @@ const OUTPUT_DIR = path.join(rootDir, 'temp', 'converted-glb')
 // Batch size for processing
 const BATCH_SIZE = 10
 
+// Extra options forwarded to blender-fbx-to-glb.py (e.g. --anim-fps 30 --anim-tolerance 0.001)
+const CONVERTER_ARGS = process.argv.slice(2)
+
 // Conversion log
 const CONVERSION_LOG = []
 
@@ -63,6 +67,21 @@ function getRelativePath(fullPath, baseDir) {
   return path.relative(baseDir, fullPath)
 }
 
+/**
+ * Parse a JSON progress event emitted by blender-fbx-to-glb.py --events stdout.
+ * Unflushed Blender output may precede the event on the same line, so the
+ * object is matched anywhere in the line.
+ */
+function parseEvent(line) {
+  const start = line.indexOf('{"event"')
+  if (start === -1) return null
+  try {
+    return JSON.parse(line.slice(start))
+  } catch {
+    return null
+  }
+}
+
 /**
  * Convert single FBX to GLB
  */
@@ -76,29 +95,44 @@ function convertFBXToGLB(inputPath, outputPath) {
 
     const pythonScript = path.join(__dirname, 'blender-fbx-to-glb.py')
     
-    // Build command
-    const command = `"${BLENDER_PATH}"`
+    // Build command (no shell, so paths and forwarded options with spaces stay intact)
     const args = [
       '--background',
+      // Uncaught Python exceptions should fail the process instead of exiting 0
+      '--python-exit-code',
+      '1',
       '--python',
       pythonScript,
       '--',
       inputPath,
-      outputPath
+      outputPath,
+      '--events',
+      'stdout',
+      ...CONVERTER_ARGS
     ]
 
     console.log(`  Converting: ${path.basename(inputPath)}`)
 
-    const process = spawn(command, args, {
-      shell: true,
+    const process = spawn(BLENDER_PATH, args, {
       stdio: ['ignore', 'pipe', 'pipe']
     })
 
     let stdout = ''
     let stderr = ''
+    let pending = ''
+    const events = []
 
     process.stdout.on('data', (data) => {
-      stdout += data.toString()
+      const text = data.toString()
+      stdout += text
+
+      // Collect complete event lines as they arrive; other output is ignored
+      const lines = (pending + text).split(/\r?\n/)
+      pending = lines.pop()
+      for (const line of lines) {
+        const event = parseEvent(line.trim())
+        if (event) events.push(event)
+      }
     })
 
     process.stderr.on('data', (data) => {
@@ -106,29 +140,49 @@ function convertFBXToGLB(inputPath, outputPath) {
     })
 
     process.on('close', (code) => {
-      // Check if output file was actually created (addon errors may not prevent export)
-      const fileExists = fs.existsSync(outputPath)
-      
-      if (fileExists || code === 0) {
+      const lastEvent = parseEvent(pending.trim())
+      if (lastEvent) events.push(lastEvent)
+
+      const done = events.find(e => e.event === 'done')
+      const failure = events.find(e => e.event === 'error')
+      const warnings = events.filter(e => e.event === 'warning').map(e => e.message)
+
+      // The converter always runs with --events stdout, so only a 'done' event
+      // counts; a crash without one must not be logged as success
+      const success = Boolean(done) && !failure
+
+      if (success) {
         const logEntry = {
           input: inputPath,
           output: outputPath,
           success: true,
+          size: done?.size,
+          elapsed: done?.elapsed,
+          warnings,
+          log: done?.log,
           timestamp: new Date().toISOString()
         }
         CONVERSION_LOG.push(logEntry)
-        console.log(`    ✓ Success`)
+        const sizeText = done ? ` (${(done.size / 1024).toFixed(2)} KB, ${done.elapsed}s)` : ''
+        const warningText = warnings.length > 0 ? `, ${warnings.length} warning(s)` : ''
+        console.log(`    ✓ Success${sizeText}${warningText}`)
         resolve(logEntry)
       } else {
+        const error = failure
+          ? [failure.message, ...(failure.captured || [])].join('\n')
+          : stderr || stdout
         const logEntry = {
           input: inputPath,
           output: outputPath,
           success: false,
-          error: stderr || stdout,
+          stage: failure?.stage,
+          exitCode: code,
+          error,
+          warnings,
           timestamp: new Date().toISOString()
         }
         CONVERSION_LOG.push(logEntry)
-        console.log(`    ✗ Failed: ${stderr || 'Unknown error'}`)
+        console.log(`    ✗ Failed${failure ? ` during ${failure.stage}` : ''}: ${failure?.message || stderr || 'Unknown error'}`)
         reject(logEntry)
       }
     })
@@ -187,11 +241,29 @@ async function convertAllFBX() {
 
   // Find all FBX files
   console.log('Scanning for FBX files...')
-  const fbxFiles = findFBXFiles(SOURCE_DIR)
-  console.log(`Found ${fbxFiles.length} FBX files\n`)
+  const foundFiles = findFBXFiles(SOURCE_DIR)
+  console.log(`Found ${foundFiles.length} FBX files`)
+
+  // Validate headers and order largest-first before any Blender process starts
+  const preflight = preflightAssets(foundFiles)
+  printPreflightReport(preflight)
+  console.log('')
+
+  for (const { file, reason } of preflight.skipped) {
+    CONVERSION_LOG.push({
+      input: file,
+      output: null,
+      success: false,
+      skipped: true,
+      error: reason,
+      timestamp: new Date().toISOString()
+    })
+  }
+
+  const fbxFiles = preflight.jobs.map(job => job.file)
 
   if (fbxFiles.length === 0) {
-    console.log('No FBX files found. Exiting.')
+    console.log('No valid FBX files found. Exiting.')
     return
   }
 
@@ -204,6 +276,7 @@ async function convertAllFBX() {
   const totalBatches = Math.ceil(fbxFiles.length / BATCH_SIZE)
   let successCount = 0
   let failCount = 0
+  const skippedCount = preflight.skipped.length
 
   for (let i = 0; i < fbxFiles.length; i += BATCH_SIZE) {
     const batchNum = Math.floor(i / BATCH_SIZE) + 1
@@ -239,9 +312,10 @@ async function convertAllFBX() {
   console.log('\n' + '='.repeat(60))
   console.log('Conversion Summary')
   console.log('='.repeat(60))
-  console.log(`Total files:  ${fbxFiles.length}`)
+  console.log(`Total files:  ${foundFiles.length}`)
   console.log(`Successful:   ${successCount}`)
   console.log(`Failed:       ${failCount}`)
+  console.log(`Skipped:      ${skippedCount}`)
   console.log(`Log saved to: ${logPath}`)
   console.log('='.repeat(60))
 }
@@ -1,27 +1,435 @@
 """
 Blender Script: FBX to GLB Converter
 Import FBX file and export as GLB
-Run from command line: blender --background --python blender-fbx-to-glb.py -- input.fbx output.glb
+Run from command line: blender --background --python blender-fbx-to-glb.py -- input.fbx output.glb [options]
+
+Animation options:
+  --anim-drop-static         Collapse channels that never change (removed if at their default value)
+  --anim-fps FPS             Resample every action to FPS before export
+  --anim-tolerance ERROR     Keyframe reduction: drop keys that linear interpolation reproduces within ERROR
+  --anim-split               Export each action to its own <output>.<action>.glb for lazy loading
+  --anim-sparse              Use sparse accessors for shape key (morph target) animation
+
+Compression options (the uncompressed GLB is always kept at the output path):
+  --compress CODECS          Comma-separated 'draco' and/or 'meshopt' variants: <output>.drc.glb / <output>.meshopt.glb
+  --quantize ATTR=BITS,...   Quantization bits (1-16) per attribute (position, normal, texcoord, color, generic)
+  --draco-level LEVEL        Draco compression level 0-10 (default 6)
+  --gltfpack PATH            gltfpack executable for meshopt (default: $GLTFPACK or PATH)
+
+Progress options:
+  --events TARGET            Write JSON-line progress events to 'stdout' or a file / named pipe
+  --log PATH                 Capture addon stderr output here (default: a temp file, removed if no errors were captured)
 """
 
 import bpy
 import sys
 import os
+import re
+import json
+import time
+import argparse
+import hashlib
+import shutil
+import tempfile
+import traceback
+import subprocess
+import contextlib
 
 # Suppress addon errors
 import logging
 logging.getLogger().setLevel(logging.ERROR)
 
+
+def iter_fcurve_collections(action):
+    """Yield the F-curve collections of an action (legacy and layered actions)"""
+    layers = getattr(action, "layers", None)
+    if layers:
+        for layer in layers:
+            for strip in layer.strips:
+                for channelbag in strip.channelbags:
+                    yield channelbag.fcurves
+    else:
+        # Legacy accessor; removed in Blender 5.0 where empty actions have no layers
+        yield getattr(action, "fcurves", ())
+
+
+def iter_channel_groups(action):
+    """
+    Yield (collection, fcurves) per animated property, components ordered by index.
+
+    glTF stores one sampler per property (e.g. a bone's rotation_quaternion), so all
+    components of a group have to share key times and interpolation or the exporter
+    re-samples the whole property at every frame.
+    """
+    for fcurves in iter_fcurve_collections(action):
+        groups = {}
+        for fcurve in fcurves:
+            groups.setdefault(fcurve.data_path, []).append(fcurve)
+        for group in groups.values():
+            yield fcurves, sorted(group, key=lambda fcurve: fcurve.array_index)
+
+
+def channel_default(fcurve):
+    """Rest value of a transform channel, or None if unknown"""
+    path = fcurve.data_path
+    if path.endswith("location") or path.endswith("rotation_euler"):
+        return 0.0
+    if path.endswith("rotation_quaternion"):
+        return 1.0 if fcurve.array_index == 0 else 0.0
+    if path.endswith("scale"):
+        return 1.0
+    return None
+
+
+def replace_keyframes(fcurve, frames, values):
+    """Replace all keyframes of an F-curve with linear keys at the given frames"""
+    keyframes = fcurve.keyframe_points
+    if hasattr(keyframes, "clear"):
+        keyframes.clear()
+    else:
+        while len(keyframes):
+            keyframes.remove(keyframes[0], fast=True)
+
+    keyframes.add(len(frames))
+    keyframes.foreach_set("co", [c for point in zip(frames, values) for c in point])
+    for keyframe in keyframes:
+        keyframe.interpolation = 'LINEAR'
+    fcurve.update()
+
+
+def reduce_frames(frames, values, tolerance):
+    """
+    Ramer-Douglas-Peucker over frames shared by several components.
+
+    `values` holds one list per component; a frame is kept if dropping it would move
+    any component by more than `tolerance`. Returns the indices of the kept frames.
+    """
+    if len(frames) < 3:
+        return list(range(len(frames)))
+
+    keep = [False] * len(frames)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(frames) - 1)]
+    while stack:
+        first, last = stack.pop()
+        f0, f1 = frames[first], frames[last]
+        worst, worst_index = tolerance, None
+        for i in range(first + 1, last):
+            t = (frames[i] - f0) / (f1 - f0) if f1 != f0 else 0.0
+            for component in values:
+                v0, v1 = component[first], component[last]
+                error = abs(component[i] - (v0 + (v1 - v0) * t))
+                if error > worst:
+                    worst, worst_index = error, i
+        if worst_index is not None:
+            keep[worst_index] = True
+            stack.append((first, worst_index))
+            stack.append((worst_index, last))
+
+    return [i for i, kept in enumerate(keep) if kept]
+
+
+def optimize_action(action, drop_static=False, resample_step=None, tolerance=0.0):
+    """
+    Trim and reduce the keyframes of an action in place, one property at a time.
+
+    Without options the action is left untouched and only counted. Returns a dict
+    with channel and keyframe counts before and after, the expected number of glTF
+    sampler keys (one time per key per property), an estimated size, and whether
+    any F-curve was removed or rewritten.
+    """
+    stats = {
+        "channels_before": 0, "channels_after": 0, "keys_before": 0, "keys_after": 0,
+        "sampler_keys": 0, "estimated_bytes": 0, "changed": False,
+    }
+    frame_start, frame_end = action.frame_range
+
+    for fcurves, group in iter_channel_groups(action):
+        stats["channels_before"] += len(group)
+        stats["keys_before"] += sum(len(fcurve.keyframe_points) for fcurve in group)
+
+        for fcurve in [fcurve for fcurve in group if not len(fcurve.keyframe_points)]:
+            fcurves.remove(fcurve)
+            group.remove(fcurve)
+            stats["changed"] = True
+        if not group:
+            continue
+
+        frames = sorted({kp.co[0] for fcurve in group for kp in fcurve.keyframe_points})
+        rewrite = False
+
+        if drop_static:
+            columns = [[kp.co[1] for kp in fcurve.keyframe_points] for fcurve in group]
+            if all(max(column) - min(column) <= max(tolerance, 1e-6) for column in columns):
+                defaults = [channel_default(fcurve) for fcurve in group]
+                if all(d is not None and abs(c[0] - d) <= 1e-6 for c, d in zip(columns, defaults)):
+                    for fcurve in group:
+                        fcurves.remove(fcurve)
+                    stats["changed"] = True
+                    continue
+                # Two keys: the exporter bakes properties with a single key
+                frames = [frame_start, frame_end] if frame_end > frame_start else [frame_start]
+                values = [[column[0]] * len(frames) for column in columns]
+                rewrite = True
+
+        if not rewrite and (resample_step or tolerance > 0):
+            if resample_step:
+                frames = []
+                frame = frame_start
+                while frame < frame_end:
+                    frames.append(frame)
+                    frame += resample_step
+                frames.append(frame_end)
+            # Evaluate every component on the same frames before changing any of them
+            values = [[fcurve.evaluate(f) for f in frames] for fcurve in group]
+            if tolerance > 0:
+                kept = reduce_frames(frames, values, tolerance)
+                frames = [frames[i] for i in kept]
+                values = [[column[i] for i in kept] for column in values]
+            rewrite = True
+
+        if rewrite:
+            for fcurve, column in zip(group, values):
+                replace_keyframes(fcurve, frames, column)
+            stats["changed"] = True
+
+        stats["channels_after"] += len(group)
+        stats["keys_after"] += sum(len(fcurve.keyframe_points) for fcurve in group)
+        stats["sampler_keys"] += len(frames)
+        # glTF stores one float time per key plus one float per component
+        stats["estimated_bytes"] += len(frames) * 4 * (1 + len(group))
+
+    return stats
+
+
+def glb_animation_keys(path):
+    """
+    Sampler key counts per animation name, read from a GLB's JSON chunk.
+
+    Used to check that reduced keyframes survive export instead of being
+    re-sampled at every frame by the exporter.
+    """
+    with open(path, "rb") as glb:
+        header = glb.read(20)
+        if len(header) < 20 or header[:4] != b"glTF":
+            return {}
+        chunk_length = int.from_bytes(header[12:16], "little")
+        if header[16:20] != b"JSON":
+            return {}
+        gltf = json.loads(glb.read(chunk_length))
+
+    accessors = gltf.get("accessors", [])
+    counts = {}
+    for index, animation in enumerate(gltf.get("animations", [])):
+        name = animation.get("name", f"animation_{index}")
+        counts[name] = counts.get(name, 0) + sum(
+            accessors[sampler["input"]]["count"] for sampler in animation.get("samplers", [])
+        )
+    return counts
+
+
+def action_targets(action, animated_objects):
+    """Objects an action belongs to (FBX actions are named 'Object|Take')"""
+    owner = action.name.split("|", 1)[0]
+    targets = [obj for obj in animated_objects if obj.name == owner]
+    if not targets:
+        targets = [obj for obj in animated_objects if obj.animation_data.action == action]
+    return targets or list(animated_objects)
+
+
+def supported_export_params(params):
+    """Drop exporter parameters this Blender version doesn't know about"""
+    properties = bpy.ops.export_scene.gltf.get_rna_type().properties
+    return {key: value for key, value in params.items() if key in properties}
+
+
+class EventStream:
+    """JSON-lines progress events for batch drivers (one object per line)"""
+
+    def __init__(self, target):
+        self.start = time.perf_counter()
+        self.warnings = 0
+        if target == "stdout":
+            self.stream = sys.stdout
+        elif target:
+            self.stream = open(target, "w", encoding="utf-8", buffering=1)
+        else:
+            self.stream = None
+
+    def emit(self, event, **fields):
+        if event == "warning":
+            self.warnings += 1
+        if self.stream is None:
+            return
+        record = {"event": event, "elapsed": round(time.perf_counter() - self.start, 3), **fields}
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+
+    def close(self):
+        if self.stream is not None and self.stream is not sys.stdout:
+            self.stream.close()
+
+
+@contextlib.contextmanager
+def capture_stderr(log_path):
+    """Redirect Python and C-level stderr to a log file, always restoring it"""
+    sys.stderr.flush()
+    log = open(log_path, "a", encoding="utf-8", errors="replace", buffering=1)
+    saved_stderr = sys.stderr
+    saved_fd = os.dup(2)
+    os.dup2(log.fileno(), 2)
+    sys.stderr = log
+    try:
+        yield
+    finally:
+        log.flush()
+        os.dup2(saved_fd, 2)
+        os.close(saved_fd)
+        sys.stderr = saved_stderr
+        log.close()
+
+
+ERROR_PATTERN = re.compile(r"\b(error|exception|traceback)\b", re.IGNORECASE)
+
+
+def captured_errors(log_path, offset=0, limit=20):
+    """Error-looking lines written to the capture log after `offset`"""
+    if not os.path.exists(log_path):
+        return []
+    with open(log_path, encoding="utf-8", errors="replace") as log:
+        log.seek(offset)
+        lines = [line.rstrip() for line in log if ERROR_PATTERN.search(line)]
+    return lines[:limit]
+
+
+def log_size(log_path):
+    return os.path.getsize(log_path) if os.path.exists(log_path) else 0
+
+
+def positive_float(text):
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+    return value
+
+
+# Exporter defaults, also used for gltfpack so both codecs compare like for like
+DEFAULT_QUANTIZATION = {"position": 14, "normal": 10, "texcoord": 12, "color": 10, "generic": 12}
+
+# Accepted bits per attribute; gltfpack's -vp/-vn/-vt/-vc only take 1-16
+QUANTIZATION_BITS = range(1, 17)
+
+# gltfpack flags per attribute (it has no generic attribute quantization)
+GLTFPACK_QUANTIZATION_FLAGS = {"position": "-vp", "normal": "-vn", "texcoord": "-vt", "color": "-vc"}
+
+# Rough mid-range mobile decode throughput in bytes of uncompressed GLB per millisecond
+DECODE_BYTES_PER_MS = {"draco": 20_000, "meshopt": 250_000}
+
+
+def parse_quantization(text):
+    """Parse 'position=14,normal=10' into a full attribute -> bits mapping"""
+    quantization = dict(DEFAULT_QUANTIZATION)
+    for item in filter(None, (text or "").split(",")):
+        attribute, _, bits = item.partition("=")
+        attribute = attribute.strip()
+        if attribute not in quantization or not bits.strip().isdigit():
+            raise argparse.ArgumentTypeError(f"invalid quantization '{item}'")
+        if int(bits) not in QUANTIZATION_BITS:
+            raise argparse.ArgumentTypeError(
+                f"{attribute} quantization must be {QUANTIZATION_BITS.start}-{QUANTIZATION_BITS.stop - 1} bits, got {bits.strip()}"
+            )
+        quantization[attribute] = int(bits)
+    return quantization
+
+
+def draco_export_params(quantization, level):
+    """glTF exporter parameters enabling Draco with per-attribute quantization"""
+    params = {
+        'export_draco_mesh_compression_enable': True,
+        'export_draco_mesh_compression_level': level,
+    }
+    for attribute, bits in quantization.items():
+        params[f'export_draco_{attribute}_quantization'] = bits
+    return params
+
+
+def meshopt_compress(source, target, quantization, gltfpack):
+    """Write an EXT_meshopt_compression copy of `source` using gltfpack"""
+    command = [gltfpack, "-i", source, "-o", target, "-cc", "-kn", "-km", "-ke"]
+    for attribute, flag in GLTFPACK_QUANTIZATION_FLAGS.items():
+        command += [flag, str(quantization[attribute])]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr or result.stdout).strip() or f"gltfpack exited with {result.returncode}")
+
+
+def estimate_decode_ms(codec, raw_size):
+    if codec not in DECODE_BYTES_PER_MS:
+        return 0.0
+    return raw_size / DECODE_BYTES_PER_MS[codec]
+
+
+def safe_name(name):
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+
+
 # Get command line arguments
 argv = sys.argv
-argv = argv[argv.index("--") + 1:]  # Get arguments after "--"
+argv = argv[argv.index("--") + 1:] if "--" in argv else []  # Get arguments after "--"
 
 if len(argv) < 2:
-    print("Usage: blender --background --python blender-fbx-to-glb.py -- input.fbx output.glb")
+    print("Usage: blender --background --python blender-fbx-to-glb.py -- input.fbx output.glb [options]")
     sys.exit(1)
 
-input_path = argv[0]
-output_path = argv[1]
+parser = argparse.ArgumentParser(prog="blender-fbx-to-glb.py")
+parser.add_argument("input")
+parser.add_argument("output")
+parser.add_argument("--anim-drop-static", action="store_true")
+parser.add_argument("--anim-fps", type=positive_float, default=None)
+parser.add_argument("--anim-tolerance", type=float, default=0.0)
+parser.add_argument("--anim-split", action="store_true")
+parser.add_argument("--anim-sparse", action="store_true")
+parser.add_argument("--compress", default="")
+parser.add_argument("--quantize", type=parse_quantization, default=parse_quantization(""))
+parser.add_argument("--draco-level", type=int, choices=range(0, 11), default=6)
+parser.add_argument("--gltfpack", default=os.environ.get("GLTFPACK") or shutil.which("gltfpack"))
+parser.add_argument("--events", default=None)
+parser.add_argument("--log", default=None)
+args = parser.parse_args(argv)
+
+codecs = [codec.strip() for codec in args.compress.split(",") if codec.strip()]
+for codec in codecs:
+    if codec not in ("draco", "meshopt"):
+        parser.error(f"unknown codec '{codec}' (use draco and/or meshopt)")
+
+input_path = args.input
+output_path = args.output
+# Default log is unique per job so parallel batch workers never share one
+output_hash = hashlib.sha1(os.path.abspath(output_path).encode("utf-8")).hexdigest()[:10]
+log_path = args.log or os.path.join(
+    tempfile.gettempdir(),
+    f"fbx-to-glb-{safe_name(os.path.basename(output_path))}-{output_hash}-{os.getpid()}.log",
+)
+events = EventStream(args.events)
+events.emit("start", input=input_path, output=output_path, log=log_path)
+
+
+def fail(stage, message, log_offset=0):
+    """Report a fatal error with any captured addon errors, then exit"""
+    print(f"ERROR: {message}")
+    errors = captured_errors(log_path, log_offset)
+    for line in errors:
+        print(f"  {line}", file=sys.stderr)
+    events.emit("error", stage=stage, message=message, captured=errors)
+    events.close()
+    sys.exit(1)
+
+
+def report_captured(stage, log_offset):
+    """Surface addon errors from a successful stage as warnings"""
+    for line in captured_errors(log_path, log_offset):
+        print(f"  ⚠ {line}")
+        events.emit("warning", stage=stage, message=line)
 
 print(f"\n{'='*50}")
 print(f"FBX to GLB Converter")
@@ -31,8 +439,7 @@ print(f"Output: {output_path}")
 
 # Check if input file exists
 if not os.path.exists(input_path):
-    print(f"ERROR: Input file not found: {input_path}")
-    sys.exit(1)
+    fail("validate", f"Input file not found: {input_path}")
 
 # Suppress addon warnings
 import warnings
@@ -49,30 +456,70 @@ for mesh in bpy.data.meshes:
     bpy.data.meshes.remove(mesh)
 
 print("Cleared scene")
+events.emit("stage", stage="clear")
 
-# Import FBX
+# Import FBX (addon noise goes to the capture log)
+log_offset = log_size(log_path)
 try:
-    bpy.ops.import_scene.fbx(
-        filepath=input_path,
-        use_image_search=True,
-        use_alpha_decals=False,
-        decal_offset=0.0,
-        use_anim=True,
-        anim_offset=1.0,
-        use_subsurf=False,
-        use_custom_props=True,
-        use_custom_props_enum_as_string=True,
-        ignore_leaf_bones=False,
-        force_connect_children=False,
-        automatic_bone_orientation=False,
-        primary_bone_axis='Y',
-        secondary_bone_axis='X',
-        use_prepost_rot=True
-    )
+    with capture_stderr(log_path):
+        bpy.ops.import_scene.fbx(
+            filepath=input_path,
+            use_image_search=True,
+            use_alpha_decals=False,
+            decal_offset=0.0,
+            use_anim=True,
+            anim_offset=1.0,
+            use_subsurf=False,
+            use_custom_props=True,
+            use_custom_props_enum_as_string=True,
+            ignore_leaf_bones=False,
+            force_connect_children=False,
+            automatic_bone_orientation=False,
+            primary_bone_axis='Y',
+            secondary_bone_axis='X',
+            use_prepost_rot=True
+        )
     print("✓ Imported FBX")
 except Exception as e:
-    print(f"ERROR: Failed to import FBX: {e}")
-    sys.exit(1)
+    fail("import", f"Failed to import FBX: {e}", log_offset)
+
+report_captured("import", log_offset)
+events.emit("stage", stage="import", objects=len(bpy.context.scene.objects), actions=len(bpy.data.actions))
+
+# Optimize animations
+scene = bpy.context.scene
+animated_objects = [obj for obj in scene.objects if obj.animation_data]
+keys_modified = False
+action_stats = {}
+
+try:
+    if bpy.data.actions and (args.anim_drop_static or args.anim_fps or args.anim_tolerance > 0):
+        resample_step = None
+        if args.anim_fps:
+            scene_fps = scene.render.fps / scene.render.fps_base
+            if args.anim_fps < scene_fps:
+                resample_step = scene_fps / args.anim_fps
+            else:
+                message = f"--anim-fps {args.anim_fps:g} is not below the scene rate ({scene_fps:g} fps); not resampling"
+                print(f"  ⚠ {message}")
+                events.emit("warning", stage="optimize", message=message)
+
+        for action in bpy.data.actions:
+            action_stats[action.name] = optimize_action(
+                action,
+                drop_static=args.anim_drop_static,
+                resample_step=resample_step,
+                tolerance=args.anim_tolerance,
+            )
+        keys_modified = any(stats["changed"] for stats in action_stats.values())
+        print(f"✓ Optimized {len(bpy.data.actions)} action(s)")
+        events.emit("stage", stage="optimize", actions=len(bpy.data.actions))
+    else:
+        for action in bpy.data.actions:
+            action_stats[action.name] = optimize_action(action)
+except Exception as e:
+    traceback.print_exc()
+    fail("optimize", f"Failed to optimize animations: {e}")
 
 # Ensure output directory exists
 output_dir = os.path.dirname(output_path)
@@ -80,12 +527,8 @@ if output_dir and not os.path.exists(output_dir):
     os.makedirs(output_dir, exist_ok=True)
     print(f"Created output directory: {output_dir}")
 
-# Suppress stderr for addon errors (they're non-fatal)
-import sys
-original_stderr = sys.stderr
-sys.stderr = open(os.devnull, 'w')
-
-# Export as GLB
+# Export as GLB (addon errors are non-fatal; they go to the capture log)
+log_offset = log_size(log_path)
 try:
     # Blender 5.1 compatible export - minimal parameters
     export_params = {
@@ -93,27 +536,147 @@ try:
         'export_format': 'GLB',
         'export_materials': 'EXPORT',
     }
-    
-    bpy.ops.export_scene.gltf(**export_params)
+
+    if args.anim_drop_static:
+        export_params['export_optimize_animation_size'] = True
+    if keys_modified:
+        # Keep our reduced keyframes instead of re-baking every frame
+        export_params['export_force_sampling'] = False
+    if args.anim_sparse:
+        export_params['export_try_sparse_sk'] = True
+        export_params['export_try_omit_sparse_sk'] = True
+    if args.anim_split:
+        export_params['export_animations'] = False
+
+    with capture_stderr(log_path):
+        bpy.ops.export_scene.gltf(**supported_export_params(export_params))
     print(f"✓ Exported GLB: {output_path}")
-    
+
     # Get file size
     if os.path.exists(output_path):
         size = os.path.getsize(output_path)
         size_kb = size / 1024
         print(f"  File size: {size_kb:.2f} KB")
-    
+        events.emit("stage", stage="export", path=output_path, size=size)
+
+    # Export each action on its own (targets only) for lazy loading
+    action_files = {}
+    if args.anim_split and animated_objects:
+        stem, _ = os.path.splitext(output_path)
+        original_actions = {obj: obj.animation_data.action for obj in animated_objects}
+
+        for action in bpy.data.actions:
+            targets = action_targets(action, animated_objects)
+            bpy.ops.object.select_all(action='DESELECT')
+            for obj in targets:
+                obj.animation_data.action = action
+                obj.select_set(True)
+
+            action_path = f"{stem}.{safe_name(action.name)}.glb"
+            action_params = dict(export_params)
+            action_params.update({
+                'filepath': action_path,
+                'use_selection': True,
+                'export_animations': True,
+                'export_animation_mode': 'ACTIVE_ACTIONS',
+            })
+            with capture_stderr(log_path):
+                bpy.ops.export_scene.gltf(**supported_export_params(action_params))
+            action_files[action.name] = action_path
+            print(f"✓ Exported action: {action_path}")
+
+        for obj, action in original_actions.items():
+            obj.animation_data.action = action
+
+    # Per-action size report (estimated from keyframes unless split), checked
+    # against the sampler keys that actually ended up in the GLB
+    if action_stats:
+        exported_keys = {}
+        if not args.anim_split and os.path.exists(output_path):
+            exported_keys = glb_animation_keys(output_path)
+
+        print("\n  Action report:")
+        for name, stats in action_stats.items():
+            path = action_files.get(name)
+            if path and os.path.exists(path):
+                action_size, estimated = os.path.getsize(path), False
+                exported = sum(glb_animation_keys(path).values())
+            else:
+                action_size, estimated = stats['estimated_bytes'], True
+                exported = exported_keys.get(name)
+            print(
+                f"  - {name}: {stats['channels_before']}→{stats['channels_after']} channels, "
+                f"{stats['keys_before']}→{stats['keys_after']} keys, "
+                f"{'~' if estimated else ''}{action_size / 1024:.2f} KB, "
+                f"exported sampler keys: {exported if exported is not None else 'n/a'} "
+                f"(expected {stats['sampler_keys']})"
+            )
+            events.emit(
+                "action", name=name, path=path, size=action_size, estimated=estimated,
+                exported_sampler_keys=exported, **stats,
+            )
+            if keys_modified and exported is not None and exported > stats['sampler_keys']:
+                message = (
+                    f"{name}: exporter wrote {exported} sampler keys, expected {stats['sampler_keys']} "
+                    "(animation was re-sampled)"
+                )
+                print(f"  ⚠ {message}")
+                events.emit("warning", stage="export", message=message)
+
 except Exception as e:
-    print(f"ERROR: Failed to export GLB: {e}")
-    import traceback
     traceback.print_exc()
-    sys.exit(1)
+    fail("export", f"Failed to export GLB: {e}", log_offset)
+
+report_captured("export", log_offset)
 
-# Restore stderr
-sys.stderr.close()
-sys.stderr = original_stderr
+# Compressed variants next to the uncompressed GLB, with a size / decode comparison
+if codecs and os.path.exists(output_path):
+    stem, _ = os.path.splitext(output_path)
+    raw_size = os.path.getsize(output_path)
+    variants = [("none", output_path)]
+    log_offset = log_size(log_path)
+
+    for codec in codecs:
+        try:
+            if codec == "draco":
+                variant_path = f"{stem}.drc.glb"
+                draco_params = dict(export_params, filepath=variant_path)
+                draco_params.update(draco_export_params(args.quantize, args.draco_level))
+                with capture_stderr(log_path):
+                    bpy.ops.export_scene.gltf(**supported_export_params(draco_params))
+            else:
+                if not args.gltfpack:
+                    raise RuntimeError("gltfpack not found (install meshoptimizer's gltfpack or pass --gltfpack)")
+                variant_path = f"{stem}.meshopt.glb"
+                meshopt_compress(output_path, variant_path, args.quantize, args.gltfpack)
+            variants.append((codec, variant_path))
+        except Exception as e:
+            print(f"  ⚠ {codec} compression failed: {e}")
+            events.emit("warning", stage="compress", message=f"{codec}: {e}")
+
+    report_captured("compress", log_offset)
+
+    print("\n  Compression report:")
+    print(f"  {'codec':<8} {'size':>11} {'ratio':>7} {'decode':>10}")
+    for codec, variant_path in variants:
+        size = os.path.getsize(variant_path)
+        ratio = size / raw_size if raw_size else 1.0
+        decode_ms = estimate_decode_ms(codec, raw_size)
+        print(f"  {codec:<8} {size / 1024:>8.2f} KB {ratio:>6.0%} {decode_ms:>7.1f} ms")
+        events.emit(
+            "compression", codec=codec, path=variant_path, size=size,
+            ratio=round(ratio, 4), decode_ms=round(decode_ms, 2),
+        )
+
+# Keep the default temp log only when it captured errors; an explicit --log is always kept
+if not args.log and not captured_errors(log_path) and os.path.exists(log_path):
+    os.remove(log_path)
+    log_path = None
+
+total_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+events.emit("done", size=total_size, warnings=events.warnings, log=log_path)
+events.close()
 
 print(f"\n{'='*50}")
 print("✓ Conversion complete!")
 print(f"{'='*50}\n")
-
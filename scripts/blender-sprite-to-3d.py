@@ -10,6 +10,10 @@ import sys
 import os
 from mathutils import Vector
 
+# Shared pixel access helper lives next to this script
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from blender_image_access import load_image
+
 # Clear existing mesh data
 bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete(use_global=False)
@@ -32,7 +36,7 @@ def create_3d_from_sprite(image_path, output_path, depth=0.5, method='extrude'):
     
     # Load image using Blender's built-in loader
     try:
-        img = bpy.data.images.load(image_path)
+        img = load_image(image_path)
     except Exception as e:
         print(f"Error loading image: {e}")
         return False
@@ -55,8 +59,7 @@ def create_3d_from_sprite(image_path, output_path, depth=0.5, method='extrude'):
         obj = bpy.context.active_object
         obj.scale = (scale_x, scale_y, depth)
         
-        # Load texture
-        img = bpy.data.images.load(image_path)
+        # Reuse the loaded sprite as texture
         texture = bpy.data.textures.new(name="SpriteTexture", type='IMAGE')
         texture.image = img
         
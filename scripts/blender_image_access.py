@@ -0,0 +1,92 @@
+"""
+Shared image access for the Blender converter scripts
+Reads image pixels once into a float32 NumPy array and caches it per image
+
+Usage from a converter script (run with blender --background --python ...):
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from blender_image_access import load_image, get_pixels, get_mip, get_alpha
+
+Never index image.pixels element by element: every access goes through the
+RNA layer and copies the whole buffer, which takes seconds on 1024x1024 sprites.
+
+Cached pixels are not refreshed automatically: call clear_cache(image) after
+image.reload(), after removing an image, or after the file on disk changes.
+"""
+
+import bpy
+import numpy as np
+
+# image key -> list of mip levels, level 0 is the full-resolution (height, width, channels) array
+_pixel_cache = {}
+
+
+def _cache_key(image):
+    # Pointers can be reused after an image is freed; names and paths identify the data
+    return (image.name_full, image.filepath)
+
+
+def load_image(image_path):
+    """Load an image, reusing it if it's already in bpy.data"""
+    return bpy.data.images.load(image_path, check_existing=True)
+
+
+def get_pixels(image):
+    """
+    Pixels of an image as a read-only float32 array of shape (height, width, channels).
+
+    Rows start at the bottom of the image, as in Blender. The array is read
+    with a single foreach_get and cached until clear_cache() is called or
+    the image size or channel count changes.
+    """
+    key = _cache_key(image)
+    levels = _pixel_cache.get(key)
+    width, height = image.size
+    channels = image.channels
+    if levels is not None and levels[0].shape != (height, width, channels):
+        levels = None
+    if levels is None:
+        buffer = np.empty(width * height * channels, dtype=np.float32)
+        image.pixels.foreach_get(buffer)
+        pixels = buffer.reshape(height, width, channels)
+        pixels.flags.writeable = False
+        levels = _pixel_cache[key] = [pixels]
+    return levels[0]
+
+
+def get_mip(image, level):
+    """
+    Box-filtered mip level of an image (level 0 is full resolution).
+
+    Each level halves both dimensions (odd rows/columns are dropped) and is
+    built from the previous level, so it's computed at most once per image.
+    """
+    pixels = get_pixels(image)
+    levels = _pixel_cache[_cache_key(image)]
+
+    while len(levels) <= level:
+        previous = levels[-1]
+        height, width = previous.shape[0] // 2, previous.shape[1] // 2
+        if height == 0 or width == 0:
+            break
+        trimmed = previous[:height * 2, :width * 2]
+        mip = trimmed.reshape(height, 2, width, 2, pixels.shape[2]).mean(axis=(1, 3), dtype=np.float32)
+        mip.flags.writeable = False
+        levels.append(mip)
+
+    return levels[min(level, len(levels) - 1)]
+
+
+def get_alpha(image, level=0):
+    """Alpha channel of an image (or mip level) as a (height, width) array"""
+    pixels = get_mip(image, level)
+    if pixels.shape[2] < 4:
+        return np.ones(pixels.shape[:2], dtype=np.float32)
+    return pixels[:, :, 3]
+
+
+def clear_cache(image=None):
+    """Drop cached pixels for one image, or for all images"""
+    if image is None:
+        _pixel_cache.clear()
+    else:
+        _pixel_cache.pop(_cache_key(image), None)
@@ -14,6 +14,7 @@ import { existsSync, readdirSync, mkdirSync } from 'fs'
 import { join, dirname, basename, extname } from 'path'
 import { fileURLToPath } from 'url'
 import { dirname as dirnameUrl } from 'path'
+import { preflightAssets, printPreflightReport } from './preflight-assets.js'
 
 const __filename = fileURLToPath(import.meta.url)
 const __dirname = dirnameUrl(__filename)
@@ -157,6 +158,16 @@ function convertSprite(inputPath, outputPath, depth = 0.5, method = 'extrude') {
   }
 }
 
+/**
+ * Validate sprite headers before launching Blender and return the valid
+ * file names, largest first. Invalid files are reported and skipped.
+ */
+function preflightSprites(dir, files) {
+  const preflight = preflightAssets(files.map(file => join(dir, file)))
+  printPreflightReport(preflight)
+  return preflight.jobs.map(job => basename(job.file))
+}
+
 function convertMonsters(depth = 0.5, method = 'extrude') {
   console.log('\n=== Converting Monster Sprites to 3D ===\n')
   
@@ -166,10 +177,11 @@ function convertMonsters(depth = 0.5, method = 'extrude') {
   }
   
   const files = readdirSync(MONSTERS_DIR).filter(f => f.endsWith('.png'))
+  const validFiles = preflightSprites(MONSTERS_DIR, files)
   let converted = 0
   let failed = 0
   
-  for (const file of files) {
+  for (const file of validFiles) {
     const inputPath = join(MONSTERS_DIR, file)
     const outputName = file.replace('.png', '.glb')
     const outputPath = join(MONSTER_MODELS_DIR, outputName)
@@ -186,7 +198,7 @@ function convertMonsters(depth = 0.5, method = 'extrude') {
     }
   }
   
-  console.log(`\n✅ Converted: ${converted}, Failed: ${failed}, Total: ${files.length}`)
+  console.log(`\n✅ Converted: ${converted}, Failed: ${failed}, Invalid: ${files.length - validFiles.length}, Total: ${files.length}`)
 }
 
 function convertNPCs(depth = 0.5, method = 'extrude') {
@@ -198,10 +210,11 @@ function convertNPCs(depth = 0.5, method = 'extrude') {
   }
   
   const files = readdirSync(NPCS_DIR).filter(f => f.endsWith('.png'))
+  const validFiles = preflightSprites(NPCS_DIR, files)
   let converted = 0
   let failed = 0
   
-  for (const file of files) {
+  for (const file of validFiles) {
     const inputPath = join(NPCS_DIR, file)
     const outputName = file.replace('.png', '.glb')
     const outputPath = join(NPC_MODELS_DIR, outputName)
@@ -218,7 +231,7 @@ function convertNPCs(depth = 0.5, method = 'extrude') {
     }
   }
   
-  console.log(`\n✅ Converted: ${converted}, Failed: ${failed}, Total: ${files.length}`)
+  console.log(`\n✅ Converted: ${converted}, Failed: ${failed}, Invalid: ${files.length - validFiles.length}, Total: ${files.length}`)
 }
 
 function convertTiles(depth = 0.5, method = 'extrude') {
@@ -230,10 +243,11 @@ function convertTiles(depth = 0.5, method = 'extrude') {
   }
   
   const files = readdirSync(ISOMETRIC_TILES_DIR).filter(f => f.endsWith('.png'))
+  const validFiles = preflightSprites(ISOMETRIC_TILES_DIR, files)
   let converted = 0
   let failed = 0
   
-  for (const file of files) {
+  for (const file of validFiles) {
     const inputPath = join(ISOMETRIC_TILES_DIR, file)
     const outputName = file.replace('.png', '.glb')
     const outputPath = join(TILE_MODELS_DIR, outputName)
@@ -256,7 +270,7 @@ function convertTiles(depth = 0.5, method = 'extrude') {
     }
   }
   
-  console.log(`\n✅ Converted: ${converted}, Failed: ${failed}, Total: ${files.length}`)
+  console.log(`\n✅ Converted: ${converted}, Failed: ${failed}, Invalid: ${files.length - validFiles.length}, Total: ${files.length}`)
 }
 
 // Parse command line arguments
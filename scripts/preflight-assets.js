@@ -0,0 +1,239 @@
+/**
+ * Pre-flight Asset Scanner
+ * Validates PNG and FBX inputs from their file headers before any Blender
+ * worker is started, so bad files are skipped and reported up front instead
+ * of failing after the scene has been booted and cleared.
+ *
+ * Usage: node scripts/preflight-assets.js [--json] <file|dir> [...]
+ */
+
+import fs from 'fs'
+import path from 'path'
+import { fileURLToPath } from 'url'
+
+const PNG_SIGNATURE = Buffer.from([0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a])
+const FBX_BINARY_MAGIC = Buffer.from('Kaydara FBX Binary  \x00', 'binary')
+
+// Valid bit depths per PNG colour type (PNG spec, table 11.1)
+const PNG_BIT_DEPTHS = {
+  0: [1, 2, 4, 8, 16], // greyscale
+  2: [8, 16], // truecolour
+  3: [1, 2, 4, 8], // indexed
+  4: [8, 16], // greyscale + alpha
+  6: [8, 16] // truecolour + alpha
+}
+
+// Rough per-unit cost weights used to order jobs; only relative values matter
+const COST_PER_PIXEL = 1
+const COST_PER_FBX_BYTE = 4
+
+/**
+ * Read `length` bytes at `position` without loading the whole file
+ */
+function readBytes(fd, position, length) {
+  const buffer = Buffer.alloc(length)
+  const bytesRead = fs.readSync(fd, buffer, 0, length, position)
+  return buffer.subarray(0, bytesRead)
+}
+
+/**
+ * Inspect a PNG header: signature, IHDR, alpha presence and IEND chunk.
+ * Only chunk headers are read; image data is never decoded.
+ */
+function inspectPNG(filePath) {
+  const size = fs.statSync(filePath).size
+  if (size < 8 + 25 + 12) {
+    throw new Error(`file too small to be a PNG (${size} bytes)`)
+  }
+
+  const fd = fs.openSync(filePath, 'r')
+  try {
+    const head = readBytes(fd, 0, 33)
+    if (!head.subarray(0, 8).equals(PNG_SIGNATURE)) {
+      throw new Error('bad PNG signature')
+    }
+    if (head.readUInt32BE(8) !== 13 || head.toString('ascii', 12, 16) !== 'IHDR') {
+      throw new Error('missing IHDR chunk')
+    }
+
+    const width = head.readUInt32BE(16)
+    const height = head.readUInt32BE(20)
+    const bitDepth = head[24]
+    const colorType = head[25]
+
+    if (width === 0 || height === 0) {
+      throw new Error(`invalid dimensions ${width}x${height}`)
+    }
+    if (!PNG_BIT_DEPTHS[colorType]?.includes(bitDepth)) {
+      throw new Error(`invalid colour type ${colorType} / bit depth ${bitDepth}`)
+    }
+
+    // Walk chunk headers (data is skipped) to find tRNS and the IEND chunk.
+    // Bytes after IEND are ignored, as libpng and Blender do.
+    let hasAlpha = colorType === 4 || colorType === 6
+    let hasEnd = false
+    let offset = 33
+    while (offset + 8 <= size) {
+      const chunk = readBytes(fd, offset, 8)
+      const type = chunk.toString('ascii', 4, 8)
+      if (type === 'tRNS') hasAlpha = true
+      if (type === 'IEND') {
+        hasEnd = true
+        break
+      }
+      offset += 12 + chunk.readUInt32BE(0)
+    }
+
+    if (!hasEnd) {
+      throw new Error('missing IEND chunk (file truncated?)')
+    }
+
+    return {
+      type: 'png',
+      size,
+      width,
+      height,
+      hasAlpha,
+      cost: width * height * COST_PER_PIXEL
+    }
+  } finally {
+    fs.closeSync(fd)
+  }
+}
+
+/**
+ * Inspect an FBX header: binary magic and version. ASCII FBX files are
+ * rejected because Blender's importer only reads binary FBX. For binary files
+ * the first node's end offset is checked against the file size to catch
+ * truncated downloads.
+ */
+function inspectFBX(filePath) {
+  const size = fs.statSync(filePath).size
+  const fd = fs.openSync(filePath, 'r')
+  try {
+    const head = readBytes(fd, 0, 35)
+
+    if (head.length >= 27 && head.subarray(0, 21).equals(FBX_BINARY_MAGIC)) {
+      const version = head.readUInt32LE(23)
+      if (version < 6000 || version > 10000) {
+        throw new Error(`unsupported FBX version ${version}`)
+      }
+      if (head.length < 35) {
+        throw new Error('file truncated after FBX header')
+      }
+      const endOffset = version >= 7500
+        ? Number(head.readBigUInt64LE(27))
+        : head.readUInt32LE(27)
+      if (endOffset > size) {
+        throw new Error(`first node ends at ${endOffset} but file is ${size} bytes (truncated?)`)
+      }
+      return { type: 'fbx', size, version, cost: size * COST_PER_FBX_BYTE }
+    }
+
+    // ASCII FBX may start with a UTF-8 byte order mark
+    const text = head.toString('utf8').replace(/^\uFEFF/, '')
+    if (text.startsWith('; FBX')) {
+      throw new Error('ASCII FBX files are not supported by Blender\'s importer (re-export as binary)')
+    }
+
+    throw new Error('not an FBX file (no binary FBX magic)')
+  } finally {
+    fs.closeSync(fd)
+  }
+}
+
+/**
+ * Inspect a single input file based on its extension
+ */
+function inspectAsset(filePath) {
+  if (!fs.existsSync(filePath)) {
+    throw new Error('file not found')
+  }
+
+  const ext = path.extname(filePath).toLowerCase()
+  if (ext === '.png') return inspectPNG(filePath)
+  if (ext === '.fbx') return inspectFBX(filePath)
+  throw new Error(`unsupported extension ${ext || '(none)'}`)
+}
+
+/**
+ * Validate a list of input files and return the runnable jobs sorted by
+ * estimated cost (largest first) plus the files that were skipped.
+ */
+function preflightAssets(files) {
+  const jobs = []
+  const skipped = []
+
+  for (const file of files) {
+    try {
+      jobs.push({ file, ...inspectAsset(file) })
+    } catch (error) {
+      skipped.push({ file, reason: error.message })
+    }
+  }
+
+  // Largest jobs first so long conversions don't end up as the tail of a batch
+  jobs.sort((a, b) => b.cost - a.cost)
+
+  return { jobs, skipped }
+}
+
+/**
+ * Print a short human-readable report of a preflight result
+ */
+function printPreflightReport({ jobs, skipped }) {
+  console.log(`Pre-flight: ${jobs.length} valid, ${skipped.length} skipped`)
+  for (const { file, reason } of skipped) {
+    console.log(`  ✗ ${path.basename(file)}: ${reason}`)
+  }
+}
+
+/**
+ * Expand directories into the PNG/FBX files they contain
+ */
+function collectInputs(targets) {
+  const files = []
+
+  function scan(target) {
+    if (fs.existsSync(target) && fs.statSync(target).isDirectory()) {
+      for (const entry of fs.readdirSync(target)) {
+        scan(path.join(target, entry))
+      }
+    } else if (/\.(png|fbx)$/i.test(target) || !fs.existsSync(target)) {
+      files.push(target)
+    }
+  }
+
+  targets.forEach(scan)
+  return files
+}
+
+// Run if called directly
+if (process.argv[1] && path.resolve(process.argv[1]) === fileURLToPath(import.meta.url)) {
+  const args = process.argv.slice(2)
+  const asJson = args.includes('--json')
+  const targets = args.filter(a => a !== '--json')
+
+  if (targets.length === 0) {
+    console.log('Usage: node scripts/preflight-assets.js [--json] <file|dir> [...]')
+    process.exit(1)
+  }
+
+  const result = preflightAssets(collectInputs(targets))
+
+  if (asJson) {
+    console.log(JSON.stringify(result, null, 2))
+  } else {
+    printPreflightReport(result)
+    for (const job of result.jobs) {
+      const detail = job.type === 'png'
+        ? `${job.width}x${job.height}${job.hasAlpha ? ' alpha' : ''}`
+        : `binary v${job.version}`
+      console.log(`  ✓ ${path.basename(job.file)} (${detail}, ${(job.size / 1024).toFixed(1)} KB)`)
+    }
+  }
+
+  process.exit(result.skipped.length > 0 ? 2 : 0)
+}
+
+export { inspectAsset, inspectFBX, inspectPNG, preflightAssets, printPreflightReport }